@@ -6,7 +6,6 @@ Handles document extraction using local VLM models via Docling.
 import gc
 from typing import List, Type
 
-import torch
 from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
 from docling.datamodel.base_models import InputFormat
 from docling.document_extractor import DocumentExtractor, ExtractionFormatOption
@@ -142,6 +141,9 @@ class VlmBackend:
         6. Memory tracking (after cleanup)
         """
         try:
+            # Imported lazily: torch is only needed here, not to load the backend module.
+            import torch
+
             # Track memory before cleanup
             memory_before = 0.0
             try:
@@ -213,6 +215,8 @@ class VlmBackend:
 
         Useful for multi-GPU setups or when model was distributed across devices.
         """
+        import torch
+
         if not torch.cuda.is_available():
             rich_print("[blue][VlmBackend][/blue] No CUDA devices available")
             return
@@ -527,6 +527,7 @@ def _infer_missing_list_entity_parents(
     path_filled: dict[str, list[Any]],
     path_descriptors: dict[str, list[dict[str, Any]]],
     catalog: DeltaNodeCatalog,
+    spec_by_path: dict[str, DeltaNodeSpec],
 ) -> None:
     """
     Add synthetic list-entity parent descriptors and filled objects when children
@@ -534,7 +535,6 @@ def _infer_missing_list_entity_parents(
     uses only catalog list paths and id_fields so it works for any schema.
     Mutates path_filled and path_descriptors in place.
     """
-    spec_by_path = {spec.path: spec for spec in catalog.nodes}
     list_entity_paths = {
         spec.path
         for spec in catalog.nodes
@@ -597,9 +597,16 @@ def merge_delta_filled_into_root(  # noqa: C901
     stats: dict[str, int | list[Any]] | None = None,
     salvage_orphans: bool = True,
     orphan_field_name: str = "__orphans__",
+    spec_by_path: dict[str, DeltaNodeSpec] | None = None,
 ) -> dict[str, Any]:
-    """Attach filled nodes to parent descriptors and build root object."""
-    _infer_missing_list_entity_parents(path_filled, path_descriptors, catalog)
+    """Attach filled nodes to parent descriptors and build root object.
+
+    Pass spec_by_path when the caller already holds the catalog's path index;
+    otherwise it is built from the catalog.
+    """
+    if spec_by_path is None:
+        spec_by_path = {spec.path: spec for spec in catalog.nodes}
+    _infer_missing_list_entity_parents(path_filled, path_descriptors, catalog, spec_by_path)
     root: dict[str, Any] = {}
     merge_counters: dict[str, int] = {
         "descriptor_length_mismatch": 0,
@@ -618,7 +625,6 @@ def merge_delta_filled_into_root(  # noqa: C901
     }
     parent_lookup_miss_examples: list[dict[str, Any]] = []
     missing_parent_examples: list[dict[str, Any]] = []
-    spec_by_path = {spec.path: spec for spec in catalog.nodes}
     lookup: dict[tuple[str, tuple[Any, ...]], dict[str, Any]] = {}
     lookup_by_path: dict[str, list[dict[str, Any]]] = {}
     lookup_entries_by_path: dict[str, list[tuple[tuple[Any, ...], dict[str, Any]]]] = {}
@@ -719,21 +725,24 @@ def merge_delta_filled_into_root(  # noqa: C901
                             break
                 if parent_obj is None:
                     if parent_ids and parent_spec.id_fields:
+                        # Canonicalize the parent's ids once; only candidates vary per iteration.
+                        parent_canonical: list[tuple[int, str]] = []
+                        for idx, id_field in enumerate(parent_spec.id_fields):
+                            parent_val = parent_ids.get(id_field)
+                            if parent_val not in (None, ""):
+                                parent_canonical.append((idx, _canonicalize_id_value(parent_val)))
                         canonical_candidates: list[dict[str, Any]] = []
                         for candidate_tuple, candidate_obj in lookup_entries_by_path.get(
                             parent_path, []
                         ):
                             candidate_ok = True
-                            for idx, field_name in enumerate(parent_spec.id_fields):
-                                parent_val = parent_ids.get(field_name)
+                            for idx, parent_canonical_val in parent_canonical:
                                 candidate_val = (
                                     candidate_tuple[idx] if idx < len(candidate_tuple) else None
                                 )
-                                if parent_val in (None, "") or candidate_val in (None, ""):
+                                if candidate_val in (None, ""):
                                     continue
-                                if _canonicalize_id_value(parent_val) != _canonicalize_id_value(
-                                    candidate_val
-                                ):
+                                if parent_canonical_val != _canonicalize_id_value(candidate_val):
                                     candidate_ok = False
                                     break
                             if candidate_ok:
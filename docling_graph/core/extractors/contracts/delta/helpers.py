@@ -314,6 +314,30 @@ def _relationship_endpoint_key(
     )
 
 
+def _cached_relationship_endpoint_key(
+    cache: dict[tuple[str, tuple[tuple[str, str, Any], ...]], Any],
+    *,
+    path: str,
+    ids: dict[str, Any],
+    dedup_policy: dict[str, DedupPolicy] | None,
+) -> tuple[str, tuple[tuple[str, str], ...]] | tuple[str, str]:
+    """Memoize _relationship_endpoint_key in a cache owned by one merge call."""
+    if not ids:
+        # Unidentified endpoints get a per-call instance key; never share one.
+        return _relationship_endpoint_key(path=path, ids=ids, dedup_policy=dedup_policy)
+    # Tag values with their type: 1, 1.0 and True hash alike but canonicalize differently.
+    cache_key = (path, tuple((k, type(v).__name__, v) for k, v in ids.items()))
+    try:
+        return cache[cache_key]
+    except TypeError:
+        # Unhashable id values: compute directly without caching.
+        return _relationship_endpoint_key(path=path, ids=ids, dedup_policy=dedup_policy)
+    except KeyError:
+        key = _relationship_endpoint_key(path=path, ids=ids, dedup_policy=dedup_policy)
+        cache[cache_key] = key
+        return key
+
+
 def merge_delta_graphs(
     graph_dicts: Iterable[dict[str, Any]],
     dedup_policy: dict[str, DedupPolicy] | None = None,
@@ -328,6 +352,9 @@ def merge_delta_graphs(
 
     node_by_key: dict[Any, dict[str, Any]] = {}
     relationships: dict[tuple[str, Any, Any, str], dict[str, Any]] = {}
+    # Relationship endpoints repeat across edges; canonicalize each (path, ids) once per merge.
+    endpoint_keys: dict[tuple[str, tuple[tuple[str, str, Any], ...]], Any] = {}
+
     merge_stats: dict[str, int] = {
         "node_inputs": 0,
         "node_dedup_merges": 0,
@@ -423,12 +450,14 @@ def merge_delta_graphs(
             source_ids_raw: dict[str, Any] = _src if isinstance(_src, dict) else {}
             _tgt = rel.get("target_ids")
             target_ids_raw: dict[str, Any] = _tgt if isinstance(_tgt, dict) else {}
-            source_key = _relationship_endpoint_key(
+            source_key = _cached_relationship_endpoint_key(
+                endpoint_keys,
                 path=str(rel.get("source_path") or ""),
                 ids=source_ids_raw,
                 dedup_policy=dedup_policy,
             )
-            target_key = _relationship_endpoint_key(
+            target_key = _cached_relationship_endpoint_key(
+                endpoint_keys,
                 path=str(rel.get("target_path") or ""),
                 ids=target_ids_raw,
                 dedup_policy=dedup_policy,
@@ -522,7 +522,6 @@ def normalize_delta_ir_batch_results(  # noqa: C901
     """Normalize batch IR outputs before global merge."""
 
     allowed_paths = {spec.path for spec in catalog.nodes}
-    {spec.path: spec for spec in catalog.nodes}
     property_fields_by_path = {spec.path: set(spec.property_fields) for spec in catalog.nodes}
     field_aliases = dict(getattr(catalog, "field_aliases", {}) or {})
     parent_by_path = {spec.path: spec.parent_path for spec in catalog.nodes}
@@ -563,6 +562,7 @@ def normalize_delta_ir_batch_results(  # noqa: C901
 
         out_nodes: list[dict[str, Any]] = []
         out_relationships: list[dict[str, Any]] = []
+        first_node_by_path: dict[str, dict[str, Any]] = {}
         salvaged_props_by_path: dict[str, dict[str, Any]] = {}
 
         for node_idx, raw_node in enumerate(graph.get("nodes", [])):
@@ -741,9 +741,10 @@ def normalize_delta_ir_batch_results(  # noqa: C901
             if config.attach_provenance:
                 normalized_node["provenance"] = provenance
             out_nodes.append(normalized_node)
+            first_node_by_path.setdefault(path, normalized_node)
 
         for target_path, path_props in salvaged_props_by_path.items():
-            target_node = next((n for n in out_nodes if n.get("path") == target_path), None)
+            target_node = first_node_by_path.get(target_path)
             if not isinstance(target_node, dict):
                 continue
             target_fields = property_fields_by_path.get(target_path, set())
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel
 
 from .....llm_clients.schema_utils import build_compact_semantic_guide
-from .catalog import DeltaNodeCatalog, build_delta_node_catalog, merge_delta_filled_into_root
+from .catalog import (
+    DeltaNodeCatalog,
+    DeltaNodeSpec,
+    build_delta_node_catalog,
+    merge_delta_filled_into_root,
+)
 
 
 def _field_aliases(model: type[BaseModel]) -> dict[str, list[str]]:
@@ -90,14 +96,28 @@ def build_catalog_prompt_block(catalog: DeltaNodeCatalog) -> str:
     return "\n".join(lines)
 
 
+@lru_cache(maxsize=32)
+def _projection_plan(
+    template: type[BaseModel],
+) -> tuple[DeltaNodeCatalog, dict[str, DeltaNodeSpec]]:
+    """
+    Get the cached catalog and path index used to project onto a template.
+
+    The schema walk only depends on the template class, so it is done once per
+    template instead of once per projected document. Callers must not mutate
+    the returned objects.
+    """
+    catalog = build_delta_node_catalog(template)
+    return catalog, {spec.path: spec for spec in catalog.nodes}
+
+
 def project_graph_to_template_root(
     merged_graph: dict[str, Any],
     template: type[BaseModel],
 ) -> tuple[dict[str, Any], dict[str, int | list[Any]]]:
     """Rebuild template-shaped root object from merged flat IR nodes."""
 
-    catalog = build_delta_node_catalog(template)
-    spec_by_path = {spec.path: spec for spec in catalog.nodes}
+    catalog, spec_by_path = _projection_plan(template)
     path_descriptors: dict[str, list[dict[str, Any]]] = {}
     path_filled: dict[str, list[dict[str, Any]]] = {}
 
@@ -105,8 +125,12 @@ def project_graph_to_template_root(
         if not isinstance(node, dict):
             continue
         path = str(node.get("path") or "").strip()
-        ids = node.get("ids") if isinstance(node.get("ids"), dict) else {}
-        parent = node.get("parent") if isinstance(node.get("parent"), dict) else None
+        ids = node.get("ids")
+        if not isinstance(ids, dict):
+            ids = {}
+        parent = node.get("parent")
+        if not isinstance(parent, dict):
+            parent = None
         if parent is None and path != "":
             parent = {"path": "", "ids": {}}
         descriptor = {"path": path, "ids": ids, "parent": parent}
@@ -122,14 +146,12 @@ def project_graph_to_template_root(
         properties: dict[str, Any] = raw_properties if isinstance(raw_properties, dict) else {}
         filled = dict(properties)
         spec = spec_by_path.get(path)
+        id_fields = (getattr(spec, "id_fields", None) or ()) if spec is not None else ()
         # Prefer ids over properties for identity fields so correct ids (e.g. offer name)
         # are not overwritten by wrong properties (e.g. guarantee block in nom).
         if spec is not None and spec.kind == "entity" and ids:
-            id_fields = getattr(spec, "id_fields", None) or ()
             for key in id_fields:
-                if key not in ids:
-                    continue
-                value = ids[key]
+                value = ids.get(key)
                 if value is None:
                     continue
                 if isinstance(value, str) and value.strip():
@@ -141,17 +163,16 @@ def project_graph_to_template_root(
             for key, value in ids.items():
                 if key not in filled and value is not None:
                     filled[key] = value
-        if spec is not None and getattr(spec, "id_fields", None):
-            for key in spec.id_fields:
-                if key not in filled:
-                    continue
-                val = filled[key]
-                if isinstance(val, list | dict):
-                    filled[key] = ""
-                elif isinstance(val, int | float | bool):
-                    filled[key] = str(val)
-                elif not isinstance(val, str):
-                    filled[key] = str(val) if val is not None else ""
+        for key in id_fields:
+            if key not in filled:
+                continue
+            val = filled[key]
+            if isinstance(val, list | dict):
+                filled[key] = ""
+            elif isinstance(val, int | float | bool):
+                filled[key] = str(val)
+            elif not isinstance(val, str):
+                filled[key] = str(val) if val is not None else ""
         path_filled.setdefault(path, []).append(filled)
 
     merge_stats: dict[str, int | list[Any]] = {}
@@ -161,5 +182,6 @@ def project_graph_to_template_root(
         catalog=catalog,
         stats=merge_stats,
         salvage_orphans=True,
+        spec_by_path=spec_by_path,
     )
     return merged_root, merge_stats
@@ -13,6 +13,7 @@ from docling_graph.cli.dependencies import (
     OptionalDependency,
     check_dependency,
     check_inference_type_available,
+    clear_dependency_cache,
     get_all_missing_dependencies,
     get_missing_dependencies,
     get_missing_for_inference_type,
@@ -69,6 +70,19 @@ class TestOptionalDependency:
         # sys should be installed
         assert result1 is True
 
+    def test_optional_dependency_is_installed_shares_cache_across_instances(self):
+        """Should look up each package once, however many instances check it."""
+        clear_dependency_cache()
+        try:
+            with patch("importlib.util.find_spec", return_value=MagicMock()) as mock_find_spec:
+                first = OptionalDependency(name="cached", package="cached_test_module")
+                second = OptionalDependency(name="cached", package="cached_test_module")
+                assert first.is_installed is True
+                assert second.is_installed is True
+            mock_find_spec.assert_called_once_with("cached_test_module")
+        finally:
+            clear_dependency_cache()
+
     def test_optional_dependency_get_install_command(self):
         """Should generate correct install command."""
         dep = OptionalDependency(name="ollama", package="ollama", extra="ollama")
@@ -2,6 +2,7 @@
 Tests for VLM backend.
 """
 
+import sys
 from typing import List
 from unittest.mock import MagicMock, patch
 
@@ -94,23 +95,24 @@ class TestVlmBackendExtractFromDocument:
 class TestVlmBackendCleanup:
     """Test VLM backend cleanup."""
 
-    @patch("docling_graph.core.extractors.backends.vlm_backend.torch")
     @patch("docling_graph.core.extractors.backends.vlm_backend.DocumentExtractor")
-    def test_cleanup_removes_extractor(self, mock_extractor_class, mock_torch):
+    def test_cleanup_removes_extractor(self, mock_extractor_class):
         """Should remove extractor reference."""
         backend = VlmBackend(model_name="test-model")
-        backend.cleanup()
+        with patch.dict(sys.modules, {"torch": MagicMock()}):
+            backend.cleanup()
 
         assert backend.doc_extractor is None
 
-    @patch("docling_graph.core.extractors.backends.vlm_backend.torch")
     @patch("docling_graph.core.extractors.backends.vlm_backend.DocumentExtractor")
-    def test_cleanup_clears_cuda(self, mock_extractor_class, mock_torch):
+    def test_cleanup_clears_cuda(self, mock_extractor_class):
         """Should clear CUDA cache if available."""
+        mock_torch = MagicMock()
         mock_torch.cuda.is_available.return_value = True
         backend = VlmBackend(model_name="test-model")
 
-        backend.cleanup()
+        with patch.dict(sys.modules, {"torch": mock_torch}):
+            backend.cleanup()
 
         mock_torch.cuda.empty_cache.assert_called()
 
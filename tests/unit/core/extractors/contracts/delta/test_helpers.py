@@ -362,6 +362,31 @@ def test_merge_delta_graphs_dedups_relationships_with_canonicalized_endpoint_ids
     assert len(merged["relationships"]) == 1
 
 
+def test_merge_delta_graphs_keeps_relationships_to_mixed_numeric_and_bool_ids() -> None:
+    """Endpoint ids 1, 1.0 and True hash alike but identify different nodes."""
+    merged = merge_delta_graphs(
+        [
+            {
+                "nodes": [],
+                "relationships": [
+                    {
+                        "edge_label": "HAS_ITEM",
+                        "source_path": "",
+                        "source_ids": {"document_number": "INV-001"},
+                        "target_path": "items[]",
+                        "target_ids": {"n": value},
+                        "properties": {},
+                    }
+                    for value in (1, 1.0, True)
+                ],
+            }
+        ]
+    )
+    target_ids = [rel["target_ids"]["n"] for rel in merged["relationships"]]
+    assert len(target_ids) == 3
+    assert {type(value) for value in target_ids} == {int, float, bool}
+
+
 def test_chunk_batches_by_token_limit_fallback_when_token_counts_shorter_than_chunks() -> None:
     """When token_counts has fewer elements than chunks, missing indices use max(1, len(chunk.split()))."""
     chunks = ["one", "two words", "three word chunk"]
@@ -1,5 +1,8 @@
+from unittest.mock import patch
+
 from pydantic import BaseModel, ConfigDict, Field
 
+from docling_graph.core.extractors.contracts.delta import schema_mapper
 from docling_graph.core.extractors.contracts.delta.catalog import build_delta_node_catalog
 from docling_graph.core.extractors.contracts.delta.helpers import (
     build_dedup_policy,
@@ -10,6 +13,7 @@ from docling_graph.core.extractors.contracts.delta.ir_normalizer import (
     normalize_delta_ir_batch_results,
 )
 from docling_graph.core.extractors.contracts.delta.schema_mapper import (
+    _projection_plan,
     project_graph_to_template_root,
 )
 
@@ -49,6 +53,23 @@ class RootWithItems(BaseModel):
     items: list[ItemWithSubitems] = Field(default_factory=list)
 
 
+class Address(BaseModel):
+    model_config = ConfigDict(graph_id_fields=["street"])
+    street: str
+
+
+class Customer(BaseModel):
+    model_config = ConfigDict(graph_id_fields=["name"])
+    name: str
+    addresses: list[Address] = Field(default_factory=list)
+
+
+class Order(BaseModel):
+    model_config = ConfigDict(graph_id_fields=["order_id"])
+    order_id: str
+    customer: Customer | None = None
+
+
 def test_projection_attaches_same_list_item_identity_under_different_parents_to_each_parent() -> (
     None
 ):
@@ -311,3 +332,60 @@ def test_projection_repairs_parent_lookup_by_canonical_id() -> None:
         li for li in merged_root["line_items"] if li.get("line_number") == "ligne-a"
     )
     assert line_ligne_a["item"]["item_code"] == "SKU-CANON"
+
+
+def test_projection_canonical_id_repair_attaches_child_under_its_own_field() -> None:
+    """Canonical-id repair must attach the child under its field name, not the parent's id field."""
+    merged_graph = {
+        "nodes": [
+            {
+                "path": "",
+                "ids": {"order_id": "ORD-1"},
+                "properties": {"order_id": "ORD-1"},
+            },
+            {
+                "path": "customer",
+                "ids": {"name": "Acme"},
+                "parent": {"path": "", "ids": {}},
+                "properties": {"name": "Acme"},
+            },
+            {
+                "path": "customer",
+                "ids": {"name": "Globex"},
+                "parent": {"path": "", "ids": {}},
+                "properties": {"name": "Globex"},
+            },
+            {
+                "path": "customer.addresses[]",
+                "ids": {"street": "1 Main St"},
+                "parent": {"path": "customer", "ids": {"name": "ÁCME"}},
+                "properties": {"street": "1 Main St"},
+            },
+        ],
+        "relationships": [],
+    }
+    merged_root, merge_stats = project_graph_to_template_root(merged_graph, Order)
+
+    assert merge_stats.get("parent_lookup_repaired_canonical_id", 0) == 1
+    assert merge_stats.get("parent_lookup_miss", 0) == 0
+    customer = merged_root["customer"]
+    assert customer["name"] == "Acme"
+    assert customer["addresses"] == [{"street": "1 Main St"}]
+
+
+def test_projection_plan_is_built_once_per_template() -> None:
+    catalog, spec_by_path = _projection_plan(Invoice)
+    assert _projection_plan(Invoice)[0] is catalog
+    assert set(spec_by_path) == set(catalog.paths())
+    assert _projection_plan(RootWithItems)[0] is not catalog
+
+
+def test_projection_reuses_cached_spec_index_when_merging() -> None:
+    _, spec_by_path = _projection_plan(Invoice)
+    with patch.object(
+        schema_mapper,
+        "merge_delta_filled_into_root",
+        wraps=schema_mapper.merge_delta_filled_into_root,
+    ) as mock_merge:
+        project_graph_to_template_root({"nodes": [], "relationships": []}, Invoice)
+    assert mock_merge.call_args.kwargs["spec_by_path"] is spec_by_path
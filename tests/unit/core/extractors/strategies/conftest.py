@@ -0,0 +1,26 @@
+"""
+Shared fixtures for extraction strategy tests.
+
+Each test module sets STRATEGY_MODULE (dotted path of the strategy module) and
+PATCHED_NAMES (attributes of that module to replace with mocks).
+"""
+
+from unittest.mock import DEFAULT, patch
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def module_patches(request):
+    """Patch the strategy module's dependencies once for the whole test module."""
+    targets = dict.fromkeys(request.module.PATCHED_NAMES, DEFAULT)
+    with patch.multiple(request.module.STRATEGY_MODULE, **targets) as mocks:
+        yield mocks
+
+
+@pytest.fixture
+def reset_patches(module_patches):
+    """Module patches with calls, return values and side effects cleared for this test."""
+    for mock in module_patches.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    return module_patches
@@ -6,8 +6,7 @@ Tests the many-to-one strategy with direct full-document extraction:
 - VLM backend support
 """
 
-from typing import List
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import DEFAULT, Mock, patch
 
 import pytest
 from pydantic import BaseModel
@@ -15,6 +14,10 @@ from pydantic import BaseModel
 from docling_graph.core.extractors.strategies.many_to_one import ManyToOneStrategy
 from docling_graph.protocols import ExtractionBackendProtocol, TextExtractionBackendProtocol
 
+STRATEGY_MODULE = "docling_graph.core.extractors.strategies.many_to_one"
+# Order matches the tuple returned by patch_deps.
+PATCHED_NAMES = ("DocumentProcessor", "merge_pydantic_models", "is_llm_backend", "is_vlm_backend")
+
 
 class MockTemplate(BaseModel):
     """Simple test template."""
@@ -23,19 +26,59 @@ class MockTemplate(BaseModel):
     value: int = 0
 
 
+# Known-valid results shared by the tests below; none of them mutates these.
+MERGED = MockTemplate(name="Merged", value=123)
+FALLBACK = MockTemplate(name="fallback", value=123)
+DIRECT = MockTemplate(name="Direct", value=1)
+PAGE_1 = MockTemplate(name="Page 1", value=10)
+PAGE_2 = MockTemplate(name="Page 2", value=20)
+
+# VLM pages returned for a source whose name contains the key.
+VLM_PAGES = {"single": (PAGE_1,), "multi": (PAGE_1, PAGE_2)}
+
+
+def llm_extract(markdown, template, context, is_partial) -> MockTemplate | None:
+    """Fail on markdown containing "fail", otherwise return the direct result."""
+    return None if "fail" in markdown else DIRECT
+
+
+def vlm_extract(source, template) -> list[MockTemplate]:
+    """Return the pages registered for the source, or no pages."""
+    pages = next((pages for key, pages in VLM_PAGES.items() if key in source), ())
+    return list(pages)
+
+
+def unrecognized_backend(backend, doc_processor, mock_is_llm, mock_is_vlm) -> None:
+    """Leave the backend neither LLM nor VLM, so extraction fails with a TypeError."""
+
+
+def raising_vlm_backend(backend, doc_processor, mock_is_llm, mock_is_vlm) -> None:
+    """Recognize the VLM backend and make its document extraction raise."""
+    mock_is_vlm.return_value = True
+    backend.extract_from_document.side_effect = RuntimeError("VLM failed")
+
+
+def empty_llm_result(backend, doc_processor, mock_is_llm, mock_is_vlm) -> None:
+    """Recognize the LLM backend and feed it markdown that yields no model."""
+    mock_is_llm.return_value = True
+    doc_processor.extract_full_markdown.return_value = "fail"
+
+
+def emitted_events(trace_data) -> dict[str, list]:
+    """Group the payloads passed to trace_data.emit by event name."""
+    events: dict[str, list] = {}
+    for call in trace_data.emit.call_args_list:
+        name, *rest = call.args
+        events.setdefault(name, []).append(rest[-1] if rest else None)
+    return events
+
+
 @pytest.fixture
 def mock_llm_backend():
     """Create a mock LLM backend."""
-    backend = MagicMock(spec=TextExtractionBackendProtocol)
-    backend.client = MagicMock()
-    backend.__class__.__name__ = "MockLlmBackend"
-
-    def mock_extract(markdown, template, context, is_partial) -> MockTemplate | None:
-        if "fail" in markdown:
-            return None
-        return template(name=context, value=len(markdown))
-
-    backend.extract_from_markdown.side_effect = mock_extract
+    backend = Mock(spec=TextExtractionBackendProtocol)
+    backend.client = Mock()
+    backend.extract_from_markdown.side_effect = llm_extract
 
     return backend
 
@@ -43,45 +86,53 @@ def mock_llm_backend():
 @pytest.fixture
 def mock_vlm_backend():
     """Create a mock VLM backend."""
-    backend = MagicMock(spec=ExtractionBackendProtocol)
-    backend.__class__.__name__ = "MockVlmBackend"
-
-    def mock_extract(source, template) -> List[MockTemplate]:
-        if "single" in source:
-            return [template(name="Page 1", value=10)]
-        if "multi" in source:
-            return [
-                template(name="Page 1", value=10),
-                template(name="Page 2", value=20),
-            ]
-        return []
-
-    backend.extract_from_document.side_effect = mock_extract
+    backend = Mock(spec=ExtractionBackendProtocol)
+    backend.extract_from_document.side_effect = vlm_extract
 
     return backend
 
 
 @pytest.fixture(autouse=True)
-def patch_deps():
-    """Patch common dependencies."""
-    with (
-        patch("docling_graph.core.extractors.strategies.many_to_one.DocumentProcessor") as mock_dp,
-        patch(
-            "docling_graph.core.extractors.strategies.many_to_one.merge_pydantic_models"
-        ) as mock_merge,
-        patch("docling_graph.core.extractors.strategies.many_to_one.is_llm_backend") as mock_is_llm,
-        patch("docling_graph.core.extractors.strategies.many_to_one.is_vlm_backend") as mock_is_vlm,
-    ):
-        mock_doc_processor = mock_dp.return_value
-        mock_doc_processor.convert_to_docling_doc.return_value = "MockDoc"
-        mock_doc_processor.extract_full_markdown.return_value = "full_doc_md"
+def patch_deps(reset_patches):
+    """Set the module-level patches to their defaults for each test."""
+    mock_dp, mock_merge, mock_is_llm, mock_is_vlm = (reset_patches[name] for name in PATCHED_NAMES)
+
+    mock_doc_processor = mock_dp.return_value
+    mock_doc_processor.convert_to_docling_doc.return_value = "MockDoc"
+    mock_doc_processor.extract_full_markdown.return_value = "full_doc_md"
+
+    mock_merge.return_value = MERGED
+
+    mock_is_llm.return_value = False
+    mock_is_vlm.return_value = False
+
+    return mock_dp, mock_merge, mock_is_llm, mock_is_vlm
+
+
+@pytest.fixture
+def doc_processor(patch_deps):
+    """DocumentProcessor instance handed to strategies built in a test."""
+    mock_dp, _, _, _ = patch_deps
+    return mock_dp.return_value
 
-        mock_merge.return_value = MockTemplate(name="Merged", value=123)
 
-        mock_is_llm.return_value = False
-        mock_is_vlm.return_value = False
+@pytest.fixture
+def vlm_strategy(mock_vlm_backend, patch_deps):
+    """Create a strategy bound to the mock VLM backend."""
+    _, _, _, mock_is_vlm = patch_deps
+    mock_is_vlm.return_value = True
+    return ManyToOneStrategy(backend=mock_vlm_backend)
 
-        yield mock_dp, mock_merge, mock_is_llm, mock_is_vlm
+
+@pytest.fixture
+def delta_ops():
+    """Patch the delta extraction entry points used by the strategy."""
+    with patch.multiple(
+        "docling_graph.core.extractors.strategies.many_to_one",
+        extract_delta_from_text=DEFAULT,
+        extract_delta_from_document=DEFAULT,
+    ) as mocks:
+        yield mocks
 
 
 class TestInitialization:
@@ -96,47 +147,36 @@ class TestInitialization:
 
         assert strategy.backend == mock_llm_backend
 
-    def test_init_with_docling_config(self, mock_llm_backend, patch_deps):
-        """Test initialization with custom docling config."""
-        _, _, mock_is_llm, _ = patch_deps
-        mock_is_llm.return_value = True
-
-        strategy = ManyToOneStrategy(
-            backend=mock_llm_backend,
-            docling_config="vision",
-        )
-
-        assert strategy.doc_processor is not None
-
-    def test_delta_initializes_chunker_with_default_tokens(self, mock_llm_backend, patch_deps):
-        """Delta mode should always pass non-empty chunker_config."""
-        mock_dp, _, mock_is_llm, _ = patch_deps
-        mock_is_llm.return_value = True
-
-        ManyToOneStrategy(
-            backend=mock_llm_backend,
-            extraction_contract="delta",
-            use_chunking=True,
-            chunk_max_tokens=None,
-        )
-
-        kwargs = mock_dp.call_args.kwargs
-        assert kwargs["chunker_config"] == {"chunk_max_tokens": 512}
-
-    def test_delta_initializes_chunker_with_custom_tokens(self, mock_llm_backend, patch_deps):
-        """Delta mode should propagate configured chunk_max_tokens."""
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            (
+                {"docling_config": "vision"},
+                {"docling_config": "vision", "chunker_config": None},
+            ),
+            # Delta mode always passes a non-empty chunker_config.
+            (
+                {"extraction_contract": "delta", "use_chunking": True, "chunk_max_tokens": None},
+                {"docling_config": "ocr", "chunker_config": {"chunk_max_tokens": 512}},
+            ),
+            (
+                {"extraction_contract": "delta", "use_chunking": True, "chunk_max_tokens": 1024},
+                {"docling_config": "ocr", "chunker_config": {"chunk_max_tokens": 1024}},
+            ),
+        ],
+        ids=["docling_config", "delta_default_tokens", "delta_custom_tokens"],
+    )
+    def test_init_configures_document_processor(
+        self, mock_llm_backend, patch_deps, kwargs, expected
+    ):
+        """Init options are forwarded to the DocumentProcessor."""
         mock_dp, _, mock_is_llm, _ = patch_deps
         mock_is_llm.return_value = True
 
-        ManyToOneStrategy(
-            backend=mock_llm_backend,
-            extraction_contract="delta",
-            use_chunking=True,
-            chunk_max_tokens=1024,
-        )
+        strategy = ManyToOneStrategy(backend=mock_llm_backend, **kwargs)
 
-        kwargs = mock_dp.call_args.kwargs
-        assert kwargs["chunker_config"] == {"chunk_max_tokens": 1024}
+        assert strategy.doc_processor is mock_dp.return_value
+        assert mock_dp.call_args.kwargs == expected
 
     def test_delta_requires_chunking_enabled(self, mock_llm_backend, patch_deps):
         """Delta mode should reject disabled chunking."""
@@ -154,55 +194,38 @@ class TestInitialization:
 class TestVLMExtraction:
     """Test VLM backend extraction."""
 
-    def test_extract_single_page(self, mock_vlm_backend, patch_deps):
-        """Test VLM extraction for single-page document."""
-        _, mock_merge, _, mock_is_vlm = patch_deps
-        mock_is_vlm.return_value = True
-
-        strategy = ManyToOneStrategy(backend=mock_vlm_backend)
-        results, _document = strategy.extract("single_page_doc.pdf", MockTemplate)
-
-        assert len(results) == 1
-        assert results[0].name == "Page 1"
-        mock_merge.assert_not_called()
-
-    def test_extract_multi_page(self, mock_vlm_backend, patch_deps):
-        """Test VLM extraction and merge for multi-page document."""
-        _, mock_merge, _, mock_is_vlm = patch_deps
-        mock_is_vlm.return_value = True
-
-        strategy = ManyToOneStrategy(backend=mock_vlm_backend)
-        results, _document = strategy.extract("multi_page_doc.pdf", MockTemplate)
-
-        assert len(results) == 1
-        assert results[0].name == "Merged"
-        mock_merge.assert_called_once()
-
-    def test_merge_failure_returns_all_pages(self, mock_vlm_backend, patch_deps):
-        """Test that VLM merge failure returns all page models (zero data loss)."""
-        _, mock_merge, _, mock_is_vlm = patch_deps
-        mock_is_vlm.return_value = True
-
-        mock_merge.return_value = None
+    @pytest.mark.parametrize(
+        ("source", "merged", "expected_names", "merge_calls"),
+        [
+            ("single_page_doc.pdf", MERGED, ["Page 1"], 0),
+            ("multi_page_doc.pdf", MERGED, ["Merged"], 1),
+            # A failed merge returns all page models (zero data loss).
+            ("multi_page_doc.pdf", None, ["Page 1", "Page 2"], 1),
+            ("empty_doc.pdf", MERGED, [], 0),
+        ],
+        ids=["single_page", "multi_page", "merge_failure", "no_pages"],
+    )
+    def test_extract_pages(
+        self, vlm_strategy, patch_deps, source, merged, expected_names, merge_calls
+    ):
+        """VLM page models are merged only when there is more than one."""
+        _, mock_merge, _, _ = patch_deps
+        mock_merge.return_value = merged
 
-        strategy = ManyToOneStrategy(backend=mock_vlm_backend)
-        results, _ = strategy.extract("multi_page_doc.pdf", MockTemplate)
+        results, _document = vlm_strategy.extract(source, MockTemplate)
 
-        assert len(results) == 2
-        assert results[0].name == "Page 1"
-        assert results[1].name == "Page 2"
+        assert [result.name for result in results] == expected_names
+        assert mock_merge.call_count == merge_calls
 
 
 class TestDirectExtraction:
     """Test direct extraction (single LLM call)."""
 
-    def test_direct_full_document_extraction(self, mock_llm_backend, patch_deps):
+    def test_direct_full_document_extraction(self, mock_llm_backend, patch_deps, doc_processor):
         """Test direct full-document extraction."""
-        mock_dp, _, mock_is_llm, _ = patch_deps
+        _, _, mock_is_llm, _ = patch_deps
         mock_is_llm.return_value = True
-
-        mock_doc_processor = mock_dp.return_value
-        mock_doc_processor.extract_full_markdown.return_value = "test content"
+        doc_processor.extract_full_markdown.return_value = "test content"
 
         strategy = ManyToOneStrategy(backend=mock_llm_backend)
         results, _ = strategy.extract("test.pdf", MockTemplate)
@@ -210,35 +233,21 @@ class TestDirectExtraction:
         assert mock_llm_backend.extract_from_markdown.called
         assert len(results) >= 0
 
-    def test_direct_failure_returns_empty(self, mock_llm_backend, patch_deps):
-        """Test that direct extraction returns empty list on failure."""
-        mock_dp, _, mock_is_llm, _ = patch_deps
-        mock_is_llm.return_value = True
-
-        mock_doc_processor = mock_dp.return_value
-        mock_doc_processor.extract_full_markdown.return_value = "fail"
-
-        strategy = ManyToOneStrategy(backend=mock_llm_backend)
-        results, _ = strategy.extract("test.pdf", MockTemplate)
-
-        assert len(results) == 0
-
-    def test_delta_falls_back_to_direct_when_no_model(self, mock_llm_backend, patch_deps):
+    def test_delta_falls_back_to_direct_when_no_model(
+        self, mock_llm_backend, patch_deps, doc_processor
+    ):
         """Delta mode should retry once with direct extraction when delta returns no model."""
-        mock_dp, _, mock_is_llm, _ = patch_deps
+        _, _, mock_is_llm, _ = patch_deps
         mock_is_llm.return_value = True
-        mock_doc_processor = mock_dp.return_value
-        mock_doc_processor.extract_full_markdown.return_value = "invoice markdown"
-        mock_doc_processor.extract_chunks_with_metadata.return_value = (
+        doc_processor.extract_full_markdown.return_value = "invoice markdown"
+        doc_processor.extract_chunks_with_metadata.return_value = (
             ["chunk1"],
             [{"chunk_id": 0, "token_count": 15, "page_numbers": [1]}],
         )
 
         mock_llm_backend.extraction_contract = "delta"
         mock_llm_backend.extract_from_chunk_batches = Mock(return_value=None)
-        mock_llm_backend.extract_from_markdown = Mock(
-            return_value=MockTemplate(name="fallback", value=123)
-        )
+        mock_llm_backend.extract_from_markdown = Mock(return_value=FALLBACK)
 
         strategy = ManyToOneStrategy(backend=mock_llm_backend, extraction_contract="delta")
         results, _ = strategy.extract("test.pdf", MockTemplate)
@@ -248,25 +257,22 @@ class TestDirectExtraction:
         mock_llm_backend.extract_from_chunk_batches.assert_called_once()
         mock_llm_backend.extract_from_markdown.assert_called_once()
 
-    def test_delta_fallback_emits_trace_event(self, mock_llm_backend, patch_deps):
+    def test_delta_fallback_emits_trace_event(self, mock_llm_backend, patch_deps, doc_processor):
         """Delta fallback should emit explicit trace diagnostics."""
-        mock_dp, _, mock_is_llm, _ = patch_deps
+        _, _, mock_is_llm, _ = patch_deps
         mock_is_llm.return_value = True
-        mock_doc_processor = mock_dp.return_value
-        mock_doc_processor.extract_full_markdown.return_value = "invoice markdown"
-        mock_doc_processor.extract_chunks_with_metadata.return_value = (
+        doc_processor.extract_full_markdown.return_value = "invoice markdown"
+        doc_processor.extract_chunks_with_metadata.return_value = (
             ["chunk1"],
             [{"chunk_id": 0, "token_count": 15, "page_numbers": [1]}],
         )
 
         mock_llm_backend.extraction_contract = "delta"
         mock_llm_backend.extract_from_chunk_batches = Mock(return_value=None)
-        mock_llm_backend.extract_from_markdown = Mock(
-            return_value=MockTemplate(name="fallback", value=123)
-        )
+        mock_llm_backend.extract_from_markdown = Mock(return_value=FALLBACK)
 
         strategy = ManyToOneStrategy(backend=mock_llm_backend, extraction_contract="delta")
-        strategy.trace_data = MagicMock()
+        strategy.trace_data = Mock()
         strategy.trace_data.latest_payload.return_value = {
             "quality_gate": {"ok": False, "reasons": ["missing_root_instance"]},
             "merge_stats": {"parent_lookup_miss": 2},
@@ -276,55 +282,38 @@ class TestDirectExtraction:
         results, _ = strategy.extract("test.pdf", MockTemplate)
 
         assert len(results) == 1
-        emit_calls = strategy.trace_data.emit.call_args_list
-        assert any(call.args[0] == "delta_failed_then_direct_fallback" for call in emit_calls)
-
-    def test_extract_unknown_backend_returns_empty_and_none(self, mock_llm_backend, patch_deps):
-        """Backend that is neither LLM nor VLM: TypeError is caught, returns [], None (106-117)."""
+        assert "delta_failed_then_direct_fallback" in emitted_events(strategy.trace_data)
+
+    @pytest.mark.parametrize(
+        ("backend_fixture", "setup", "expected_doc"),
+        [
+            ("mock_llm_backend", unrecognized_backend, None),
+            ("mock_vlm_backend", raising_vlm_backend, None),
+            # Direct extraction yields no model; the converted document is kept.
+            ("mock_llm_backend", empty_llm_result, "MockDoc"),
+        ],
+        ids=["unknown_backend", "vlm_raises", "llm_returns_none"],
+    )
+    def test_extract_failure_returns_empty(
+        self, request, patch_deps, doc_processor, backend_fixture, setup, expected_doc
+    ):
+        """Failed extraction returns no models instead of raising."""
         _, _, mock_is_llm, mock_is_vlm = patch_deps
-        mock_is_llm.return_value = False
-        mock_is_vlm.return_value = False
+        backend = request.getfixturevalue(backend_fixture)
+        setup(backend, doc_processor, mock_is_llm, mock_is_vlm)
 
-        strategy = ManyToOneStrategy(backend=mock_llm_backend)
+        strategy = ManyToOneStrategy(backend=backend)
         results, doc = strategy.extract("test.pdf", MockTemplate)
 
         assert results == []
-        assert doc is None
-
-    def test_vlm_exception_returns_empty_and_none(self, mock_vlm_backend, patch_deps):
-        """VLM extract_from_document raises -> returns [], None and logger.error (148-153)."""
-        _, _, _, mock_is_vlm = patch_deps
-        mock_is_vlm.return_value = True
-        mock_vlm_backend.extract_from_document.side_effect = RuntimeError("VLM failed")
-
-        strategy = ManyToOneStrategy(backend=mock_vlm_backend)
-        results, doc = strategy.extract("test.pdf", MockTemplate)
-
-        assert results == []
-        assert doc is None
-
-    def test_vlm_merge_returns_none_returns_all_page_models(self, mock_vlm_backend, patch_deps):
-        """VLM merge_pydantic_models returns None -> return all page models (144-146)."""
-        _, mock_merge, _, mock_is_vlm = patch_deps
-        mock_is_vlm.return_value = True
-        page1 = MockTemplate(name="P1", value=1)
-        page2 = MockTemplate(name="P2", value=2)
-        mock_vlm_backend.extract_from_document.side_effect = None
-        mock_vlm_backend.extract_from_document.return_value = [page1, page2]
-        mock_merge.return_value = None
-
-        strategy = ManyToOneStrategy(backend=mock_vlm_backend)
-        results, _ = strategy.extract("multi.pdf", MockTemplate)
+        assert doc == expected_doc
 
-        assert len(results) == 2
-        assert results[0].name == "P1" and results[1].name == "P2"
-
-    @patch("docling_graph.core.extractors.strategies.many_to_one.extract_delta_from_text")
     def test_extract_direct_mode_from_text_delta_path_emits_trace(
-        self, mock_extract_delta, mock_llm_backend, patch_deps
+        self, mock_llm_backend, patch_deps, delta_ops
     ):
         """_extract_direct_mode_from_text with delta contract and trace_data emits events (218-264)."""
-        _mock_dp, _, mock_is_llm, _ = patch_deps
+        _, _, mock_is_llm, _ = patch_deps
+        mock_extract_delta = delta_ops["extract_delta_from_text"]
         mock_is_llm.return_value = True
         mock_llm_backend.extract_from_chunk_batches = Mock(return_value=None)
         mock_llm_backend.extract_from_markdown = Mock(return_value=MockTemplate(name="T", value=1))
@@ -334,7 +323,7 @@ class TestDirectExtraction:
             backend=mock_llm_backend,
             extraction_contract="delta",
         )
-        strategy.trace_data = MagicMock()
+        strategy.trace_data = Mock()
 
         # Call _extract_direct_mode_from_text directly (entry used by pipeline for text input)
         results, _ = strategy._extract_with_llm_from_text(
@@ -343,18 +332,16 @@ class TestDirectExtraction:
 
         assert len(results) == 1
         assert results[0].name == "Delta"
-        emit_calls = [c[0][0] for c in strategy.trace_data.emit.call_args_list]
-        assert (
-            "page_markdown_extracted" in emit_calls or "docling_conversion_completed" in emit_calls
-        )
-        assert "extraction_completed" in emit_calls
+        events = emitted_events(strategy.trace_data)
+        assert "page_markdown_extracted" in events or "docling_conversion_completed" in events
+        assert "extraction_completed" in events
 
-    @patch("docling_graph.core.extractors.strategies.many_to_one.extract_delta_from_text")
     def test_extract_direct_mode_from_text_exception_emits_extraction_failed(
-        self, mock_extract_delta, mock_llm_backend, patch_deps
+        self, mock_llm_backend, patch_deps, delta_ops
     ):
         """_extract_direct_mode_from_text exception -> extraction_failed emit and [], None (274-290)."""
-        _mock_dp, _, mock_is_llm, _ = patch_deps
+        _, _, mock_is_llm, _ = patch_deps
+        mock_extract_delta = delta_ops["extract_delta_from_text"]
         mock_is_llm.return_value = True
         mock_llm_backend.extract_from_chunk_batches = Mock()
         mock_extract_delta.side_effect = RuntimeError("delta failed")
@@ -363,23 +350,22 @@ class TestDirectExtraction:
             backend=mock_llm_backend,
             extraction_contract="delta",
         )
-        strategy.trace_data = MagicMock()
+        strategy.trace_data = Mock()
 
         results, _ = strategy._extract_with_llm_from_text(mock_llm_backend, "text", MockTemplate)
 
         assert results == []
-        emit_calls = [c[0][0] for c in strategy.trace_data.emit.call_args_list]
-        assert "extraction_failed" in emit_calls
+        assert "extraction_failed" in emitted_events(strategy.trace_data)
 
     def test_extract_direct_mode_no_model_returns_empty_list_and_document(
-        self, mock_llm_backend, patch_deps
+        self, mock_llm_backend, patch_deps, doc_processor
     ):
         """Direct path: extract_from_markdown returns None -> [], document (462-464)."""
-        mock_dp, _, mock_is_llm, _ = patch_deps
+        _, _, mock_is_llm, _ = patch_deps
         mock_is_llm.return_value = True
-        mock_doc = MagicMock()
-        mock_dp.return_value.convert_to_docling_doc.return_value = mock_doc
-        mock_dp.return_value.extract_full_markdown.return_value = "full md"
+        mock_doc = Mock()
+        doc_processor.convert_to_docling_doc.return_value = mock_doc
+        doc_processor.extract_full_markdown.return_value = "full md"
         mock_llm_backend.extract_from_markdown.side_effect = None
         mock_llm_backend.extract_from_markdown.return_value = None
 
@@ -389,46 +375,45 @@ class TestDirectExtraction:
         assert results == []
         assert doc is mock_doc
 
-    @patch("docling_graph.core.extractors.strategies.many_to_one.extract_delta_from_document")
     def test_delta_fallback_returned_no_model_emits_trace(
-        self, mock_extract_delta_doc, mock_llm_backend, patch_deps
+        self, mock_llm_backend, patch_deps, doc_processor, delta_ops
     ):
         """Delta returns None, direct fallback returns None -> emit direct_fallback_returned_no_model (374-386)."""
-        mock_dp, _, mock_is_llm, _ = patch_deps
+        _, _, mock_is_llm, _ = patch_deps
+        mock_extract_delta_doc = delta_ops["extract_delta_from_document"]
         mock_is_llm.return_value = True
-        mock_dp.return_value.convert_to_docling_doc.return_value = MagicMock()
-        mock_dp.return_value.extract_full_markdown.return_value = "md"
+        doc_processor.convert_to_docling_doc.return_value = Mock()
+        doc_processor.extract_full_markdown.return_value = "md"
         mock_extract_delta_doc.return_value = (None, 0.0)
         mock_llm_backend.extraction_contract = "delta"
         mock_llm_backend.extract_from_chunk_batches = Mock()
         mock_llm_backend.extract_from_markdown = Mock(return_value=None)
 
         strategy = ManyToOneStrategy(backend=mock_llm_backend, extraction_contract="delta")
-        strategy.trace_data = MagicMock()
+        strategy.trace_data = Mock()
         strategy.trace_data.latest_payload.return_value = {}
 
         results, _ = strategy.extract("test.pdf", MockTemplate)
 
         assert results == []
-        emit_calls = strategy.trace_data.emit.call_args_list
-        reasons = []
-        for c in emit_calls:
-            if len(c[0]) >= 3 and isinstance(c[0][2], dict) and "reason" in c[0][2]:
-                reasons.append(c[0][2]["reason"])
-        assert any(
-            c[0][2].get("reason") == "direct_fallback_returned_no_model"
-            for c in emit_calls
-            if len(c[0]) > 2 and isinstance(c[0][2], dict)
-        ), f"Expected emit with reason direct_fallback_returned_no_model, got reasons={reasons}"
-
-    @patch("docling_graph.core.extractors.strategies.many_to_one.extract_delta_from_document")
+        reasons = {
+            payload.get("reason")
+            for payloads in emitted_events(strategy.trace_data).values()
+            for payload in payloads
+            if isinstance(payload, dict)
+        }
+        assert "direct_fallback_returned_no_model" in reasons, (
+            f"Expected emit with reason direct_fallback_returned_no_model, got reasons={reasons}"
+        )
+
     def test_extract_direct_fallback_model_switches_contract_then_restores(
-        self, mock_extract_delta_doc, mock_llm_backend, patch_deps
+        self, mock_llm_backend, patch_deps, doc_processor, delta_ops
     ):
         """_extract_direct_fallback_model sets backend.extraction_contract to direct then restores (394-418)."""
-        mock_dp, _, mock_is_llm, _ = patch_deps
+        _, _, mock_is_llm, _ = patch_deps
+        mock_extract_delta_doc = delta_ops["extract_delta_from_document"]
         mock_is_llm.return_value = True
-        mock_dp.return_value.extract_full_markdown.return_value = "full md"
+        doc_processor.extract_full_markdown.return_value = "full md"
         mock_extract_delta_doc.return_value = (None, 0.0)
         mock_llm_backend.extraction_contract = "delta"
         mock_llm_backend.extract_from_markdown = Mock(
@@ -1,23 +1,39 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, patch
 
 import pytest
 
 from docling_graph.core.extractors.document_processor import DocumentProcessor
 
 
+def export_page_markdown(page_no=None) -> str:
+    """Stand-in for DoclingDocument.export_to_markdown."""
+    return "Full MD" if page_no is None else f"Page {page_no} MD"
+
+
+@pytest.fixture(autouse=True)
+def mock_converter_class():
+    """Patch DocumentConverter so no test builds a real Docling pipeline."""
+    with patch("docling_graph.core.extractors.document_processor.DocumentConverter") as mock:
+        yield mock
+
+
+@pytest.fixture
+def processor(mock_converter_class):
+    """Default DocumentProcessor built on the patched converter."""
+    return DocumentProcessor()
+
+
 @pytest.fixture
 def mock_docling_doc():
     """Mock DoclingDocument."""
-    doc = MagicMock()
+    doc = Mock()
     doc.pages = {1: "page1", 2: "page2"}
     doc.num_pages.return_value = 2
     doc.export_to_markdown.return_value = "Full Markdown"
     return doc
 
 
-@patch("docling_graph.core.extractors.document_processor.DocumentConverter")
-@patch("docling_graph.core.extractors.document_processor.DocumentChunker")
-def test_init_default_ocr(mock_chunker_class, mock_converter_class):
+def test_init_default_ocr(mock_converter_class):
     """Test default 'ocr' initialization."""
     processor = DocumentProcessor(docling_config="ocr")
 
@@ -26,9 +42,7 @@ def test_init_default_ocr(mock_chunker_class, mock_converter_class):
     mock_converter_class.assert_called_once()
 
 
-@patch("docling_graph.core.extractors.document_processor.DocumentConverter")
-@patch("docling_graph.core.extractors.document_processor.DocumentChunker")
-def test_init_vision(mock_chunker_class, mock_converter_class):
+def test_init_vision(mock_converter_class):
     """Test 'vision' initialization."""
     processor = DocumentProcessor(docling_config="vision")
 
@@ -37,9 +51,8 @@ def test_init_vision(mock_chunker_class, mock_converter_class):
     mock_converter_class.assert_called_once()
 
 
-@patch("docling_graph.core.extractors.document_processor.DocumentConverter")
 @patch("docling_graph.core.extractors.document_processor.DocumentChunker")
-def test_init_with_chunker(mock_chunker_class, mock_converter_class):
+def test_init_with_chunker(mock_chunker_class):
     """Test initialization with chunker configuration."""
     chunker_config = {"chunk_max_tokens": 4096}
     processor = DocumentProcessor(chunker_config=chunker_config)
@@ -48,78 +61,82 @@ def test_init_with_chunker(mock_chunker_class, mock_converter_class):
     mock_chunker_class.assert_called_with(**chunker_config)
 
 
-@patch("docling_graph.core.extractors.document_processor.DocumentConverter")
-def test_convert_to_docling_doc(mock_converter_class, mock_docling_doc):
+def test_convert_to_docling_doc(processor, mock_converter_class, mock_docling_doc):
     """Test document conversion call."""
     mock_converter_instance = mock_converter_class.return_value
 
     # Mock the result object
-    mock_result = MagicMock()
+    mock_result = Mock()
     mock_result.document = mock_docling_doc
     mock_converter_instance.convert.return_value = mock_result
 
-    processor = DocumentProcessor()
     doc = processor.convert_to_docling_doc("source/path")
 
     mock_converter_instance.convert.assert_called_with("source/path")
     assert doc == mock_docling_doc
 
 
-def test_extract_page_markdowns(mock_docling_doc):
-    """Test extracting markdown page by page."""
-    processor = DocumentProcessor()
+@pytest.mark.parametrize(
+    ("page_numbers", "expected"),
+    [
+        ([1, 2], ["Page 1 MD", "Page 2 MD"]),
+        ([0, 1], ["Page 0 MD", "Page 1 MD"]),
+        ([3, 1, 2], ["Page 1 MD", "Page 2 MD", "Page 3 MD"]),
+        ([], []),
+    ],
+    ids=["from_one", "from_zero", "unordered", "no_pages"],
+)
+def test_extract_page_markdowns(processor, mock_docling_doc, page_numbers, expected):
+    """Test extracting markdown page by page, in page order."""
+    mock_docling_doc.pages = dict.fromkeys(page_numbers, Mock())
+    mock_docling_doc.export_to_markdown.side_effect = export_page_markdown
 
-    def export_side_effect(page_no=None) -> str:
-        if page_no == 1:
-            return "Page 1 MD"
-        if page_no == 2:
-            return "Page 2 MD"
-        return "Full MD"
+    markdowns = processor.extract_page_markdowns(mock_docling_doc)
+
+    assert markdowns == expected
 
-    mock_docling_doc.export_to_markdown.side_effect = export_side_effect
+
+def test_extract_page_markdowns_keeps_empty_pages(processor, mock_docling_doc):
+    """An empty page still gets its own entry so page numbers stay aligned."""
+    mock_docling_doc.pages = dict.fromkeys([1, 2, 3], Mock())
+    mock_docling_doc.export_to_markdown.side_effect = lambda page_no=None: (
+        "" if page_no == 2 else export_page_markdown(page_no)
+    )
 
     markdowns = processor.extract_page_markdowns(mock_docling_doc)
 
-    assert markdowns == ["Page 1 MD", "Page 2 MD"]
-    mock_docling_doc.export_to_markdown.assert_any_call(page_no=1)
-    mock_docling_doc.export_to_markdown.assert_any_call(page_no=2)
+    assert markdowns == ["Page 1 MD", "", "Page 3 MD"]
 
 
-def test_extract_full_markdown(mock_docling_doc):
+def test_extract_full_markdown(processor, mock_docling_doc):
     """Test extracting the full document markdown."""
-    processor = DocumentProcessor()
     md = processor.extract_full_markdown(mock_docling_doc)
 
     assert md == "Full Markdown"
     mock_docling_doc.export_to_markdown.assert_called_with()
 
 
-@patch("docling_graph.core.extractors.document_processor.DocumentConverter")
-def test_extract_chunks_no_chunker_raises_error(mock_converter_class):
+def test_extract_chunks_no_chunker_raises_error(processor):
     """Test that extract_chunks fails if chunker is not configured."""
-    processor = DocumentProcessor()  # No chunker_config
-
     with pytest.raises(ValueError, match="Chunker not initialized"):
-        processor.extract_chunks(MagicMock())
+        processor.extract_chunks(Mock())
 
 
-@patch("docling_graph.core.extractors.document_processor.DocumentConverter")
 @patch("docling_graph.core.extractors.document_processor.DocumentChunker")
-def test_extract_chunks_no_stats(mock_chunker_class, mock_converter_class):
+def test_extract_chunks_no_stats(mock_chunker_class):
     """Test extract_chunks without stats."""
     mock_chunker_instance = mock_chunker_class.return_value
     mock_chunker_instance.chunk_document.return_value = ["chunk1", "chunk2"]
 
     processor = DocumentProcessor(chunker_config={"chunk_max_tokens": 1024})
-    chunks = processor.extract_chunks(MagicMock(), with_stats=False)
+    chunks = processor.extract_chunks(Mock(), with_stats=False)
 
     assert chunks == ["chunk1", "chunk2"]
     mock_chunker_instance.chunk_document.assert_called_once()
 
 
-@patch("docling_graph.core.extractors.document_processor.DocumentConverter")
 @patch("docling_graph.core.extractors.document_processor.DocumentChunker")
-def test_extract_chunks_with_stats(mock_chunker_class, mock_converter_class):
+def test_extract_chunks_with_stats(mock_chunker_class):
     """Test extract_chunks with stats."""
     mock_chunker_instance = mock_chunker_class.return_value
     mock_chunker_instance.chunk_document_with_stats.return_value = (
@@ -128,32 +145,22 @@ def test_extract_chunks_with_stats(mock_chunker_class, mock_converter_class):
     )
 
     processor = DocumentProcessor(chunker_config={"chunk_max_tokens": 1024})
-    chunks, stats = processor.extract_chunks(MagicMock(), with_stats=True)
+    chunks, stats = processor.extract_chunks(Mock(), with_stats=True)
 
     assert chunks == ["chunk1", "chunk2"]
     assert stats["total_chunks"] == 2
     mock_chunker_instance.chunk_document_with_stats.assert_called_once()
 
 
-@patch("docling_graph.core.extractors.document_processor.DocumentConverter")
-@patch("docling_graph.core.extractors.document_processor.DocumentChunker")
-def test_process_document(mock_chunker_class, mock_converter_class, mock_docling_doc):
+def test_process_document(processor, mock_converter_class, mock_docling_doc):
     """Test the high-level process_document helper."""
     mock_converter_instance = mock_converter_class.return_value
-    mock_result = MagicMock()
+    mock_result = Mock()
     mock_result.document = mock_docling_doc
     mock_converter_instance.convert.return_value = mock_result
 
-    def export_side_effect(page_no=None) -> str:
-        if page_no == 1:
-            return "Page 1 MD"
-        if page_no == 2:
-            return "Page 2 MD"
-        return "Full MD"
-
-    mock_docling_doc.export_to_markdown.side_effect = export_side_effect
+    mock_docling_doc.export_to_markdown.side_effect = export_page_markdown
 
-    processor = DocumentProcessor()
     markdowns = processor.process_document("source/path")
 
     mock_converter_instance.convert.assert_called_with("source/path")
@@ -30,6 +30,12 @@ class ConcreteExtractor(BaseExtractor):
         return [template(name="test", value=1)], None
 
 
+@pytest.fixture(scope="module")
+def extractor():
+    """Stateless extractor shared by the tests that only call extract()."""
+    return ConcreteExtractor()
+
+
 class TestBaseExtractor:
     """Test BaseExtractor abstract class."""
 
@@ -49,17 +55,15 @@ class TestBaseExtractor:
         assert hasattr(BaseExtractor.extract, "__isabstractmethod__")
         assert BaseExtractor.extract.__isabstractmethod__ is True
 
-    def test_extract_method_signature(self):
+    def test_extract_method_signature(self, extractor):
         """Extract method should accept source and template."""
-        extractor = ConcreteExtractor()
         models, _document = extractor.extract("test.pdf", SampleExtractModel)
 
         assert isinstance(models, list)
         assert len(models) > 0
 
-    def test_extract_returns_tuple(self):
+    def test_extract_returns_tuple(self, extractor):
         """Extract should return tuple of (list of models, document)."""
-        extractor = ConcreteExtractor()
         result = extractor.extract("test.pdf", SampleExtractModel)
 
         assert isinstance(result, tuple)
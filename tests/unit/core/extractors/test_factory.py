@@ -1,40 +1,79 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, patch
 
 import pytest
 
 from docling_graph.core.extractors.factory import ExtractorFactory
-from docling_graph.core.extractors.strategies.many_to_one import ManyToOneStrategy
-from docling_graph.core.extractors.strategies.one_to_one import OneToOneStrategy
 
 
-@patch("docling_graph.core.extractors.factory.LlmBackend")
-@patch("docling_graph.core.extractors.factory.ManyToOneStrategy")
-def test_create_llm_many_to_one(mock_strategy, mock_backend):
-    """Test creating LLM backend with many-to-one strategy."""
-    mock_llm_client = MagicMock()
-    mock_llm_client.__class__.__name__ = "MockLLMClient"
+@pytest.fixture
+def factory_mocks():
+    """Patch the backend and strategy classes the factory instantiates."""
+    with patch.multiple(
+        "docling_graph.core.extractors.factory",
+        LlmBackend=DEFAULT,
+        VlmBackend=DEFAULT,
+        OneToOneStrategy=DEFAULT,
+        ManyToOneStrategy=DEFAULT,
+    ) as mocks:
+        yield mocks
+
+
+@pytest.fixture(scope="module")
+def llm_client():
+    """Stand-in client; the factory only passes it through to the backend."""
+    return object()
+
+
+@pytest.mark.parametrize(
+    ("processing_mode", "extraction_contract", "strategy_name", "expected_contract"),
+    [
+        # None leaves extraction_contract at the factory default.
+        ("many-to-one", None, "ManyToOneStrategy", "direct"),
+        ("one-to-one", None, "OneToOneStrategy", "direct"),
+        # Delta contract is passed through for many-to-one (chunk-based graph extraction).
+        ("many-to-one", "delta", "ManyToOneStrategy", "delta"),
+        # Staged/delta contracts apply only to many-to-one; one-to-one falls back to direct.
+        ("one-to-one", "staged", "OneToOneStrategy", "direct"),
+        ("one-to-one", "delta", "OneToOneStrategy", "direct"),
+    ],
+)
+def test_create_llm_extractor(
+    factory_mocks,
+    llm_client,
+    processing_mode,
+    extraction_contract,
+    strategy_name,
+    expected_contract,
+):
+    """Test creating an LLM backend and the strategy for each mode and contract."""
+    mock_backend = factory_mocks["LlmBackend"]
+    mock_strategy = factory_mocks[strategy_name]
+    contract = {} if extraction_contract is None else {"extraction_contract": extraction_contract}
 
     ExtractorFactory.create_extractor(
-        processing_mode="many-to-one",
+        processing_mode=processing_mode,
         backend_name="llm",
-        llm_client=mock_llm_client,
+        llm_client=llm_client,
         docling_config="ocr",
+        **contract,
     )
 
     mock_backend.assert_called_once_with(
-        llm_client=mock_llm_client,
-        extraction_contract="direct",
+        llm_client=llm_client,
+        extraction_contract=expected_contract,
         staged_config=None,
         structured_output=True,
         structured_sparse_check=True,
     )
     mock_strategy.assert_called_once()
+    assert mock_strategy.call_args.kwargs["backend"] is mock_backend.return_value
 
 
-@patch("docling_graph.core.extractors.factory.VlmBackend")
-@patch("docling_graph.core.extractors.factory.ManyToOneStrategy")
-def test_create_vlm_many_to_one(mock_strategy, mock_backend):
+def test_create_vlm_many_to_one(factory_mocks):
     """Test creating VLM backend with many-to-one strategy."""
+    mock_backend = factory_mocks["VlmBackend"]
+    mock_strategy = factory_mocks["ManyToOneStrategy"]
+
     ExtractorFactory.create_extractor(
         processing_mode="many-to-one",
         backend_name="vlm",
@@ -46,100 +85,6 @@ def test_create_vlm_many_to_one(mock_strategy, mock_backend):
     mock_strategy.assert_called_once()
 
 
-@patch("docling_graph.core.extractors.factory.LlmBackend")
-@patch("docling_graph.core.extractors.factory.OneToOneStrategy")
-def test_create_one_to_one(mock_strategy, mock_backend):
-    """Test creating one-to-one strategy."""
-    mock_llm_client = MagicMock()
-
-    ExtractorFactory.create_extractor(
-        processing_mode="one-to-one",
-        backend_name="llm",
-        llm_client=mock_llm_client,
-        docling_config="ocr",
-    )
-
-    mock_backend.assert_called_once_with(
-        llm_client=mock_llm_client,
-        extraction_contract="direct",
-        staged_config=None,
-        structured_output=True,
-        structured_sparse_check=True,
-    )
-    mock_strategy.assert_called_once()
-
-
-@patch("docling_graph.core.extractors.factory.LlmBackend")
-@patch("docling_graph.core.extractors.factory.OneToOneStrategy")
-def test_staged_contract_falls_back_to_direct_for_one_to_one(mock_strategy, mock_backend):
-    mock_llm_client = MagicMock()
-
-    ExtractorFactory.create_extractor(
-        processing_mode="one-to-one",
-        backend_name="llm",
-        extraction_contract="staged",
-        llm_client=mock_llm_client,
-        docling_config="ocr",
-    )
-
-    mock_backend.assert_called_once_with(
-        llm_client=mock_llm_client,
-        extraction_contract="direct",
-        staged_config=None,
-        structured_output=True,
-        structured_sparse_check=True,
-    )
-    mock_strategy.assert_called_once()
-
-
-@patch("docling_graph.core.extractors.factory.LlmBackend")
-@patch("docling_graph.core.extractors.factory.ManyToOneStrategy")
-def test_delta_contract_passed_for_many_to_one(mock_strategy, mock_backend):
-    """Delta contract is passed through for many-to-one (chunk-based graph extraction)."""
-    mock_llm_client = MagicMock()
-
-    ExtractorFactory.create_extractor(
-        processing_mode="many-to-one",
-        backend_name="llm",
-        extraction_contract="delta",
-        llm_client=mock_llm_client,
-        docling_config="ocr",
-    )
-
-    mock_backend.assert_called_once_with(
-        llm_client=mock_llm_client,
-        extraction_contract="delta",
-        staged_config=None,
-        structured_output=True,
-        structured_sparse_check=True,
-    )
-    mock_strategy.assert_called_once()
-
-
-@patch("docling_graph.core.extractors.factory.LlmBackend")
-@patch("docling_graph.core.extractors.factory.OneToOneStrategy")
-def test_delta_contract_falls_back_to_direct_for_one_to_one(mock_strategy, mock_backend):
-    """Delta contract applies only to many-to-one; one-to-one falls back to direct."""
-    mock_llm_client = MagicMock()
-
-    ExtractorFactory.create_extractor(
-        processing_mode="one-to-one",
-        backend_name="llm",
-        extraction_contract="delta",
-        llm_client=mock_llm_client,
-        docling_config="ocr",
-    )
-
-    mock_backend.assert_called_once_with(
-        llm_client=mock_llm_client,
-        extraction_contract="direct",
-        staged_config=None,
-        structured_output=True,
-        structured_sparse_check=True,
-    )
-    mock_strategy.assert_called_once()
-
-
 def test_create_vlm_without_model_name():
     """Test that VLM without model_name raises error."""
     with pytest.raises(ValueError, match="VLM requires model_name"):
@@ -158,24 +103,21 @@ def test_create_llm_without_client():
         )
 
 
-def test_unknown_backend():
+def test_unknown_backend(llm_client):
     """Test that unknown backend raises error."""
     with pytest.raises(ValueError, match="Unknown backend"):
         ExtractorFactory.create_extractor(
             processing_mode="many-to-one",
             backend_name="unknown",
-            llm_client=MagicMock(),
+            llm_client=llm_client,
         )
 
 
-def test_unknown_processing_mode():
+def test_unknown_processing_mode(factory_mocks, llm_client):
     """Test that unknown processing mode raises error."""
-    mock_client = MagicMock()
-    mock_client.context_limit = 8192  # Set as integer to avoid TypeError
-    mock_client._max_new_tokens = None  # Set to None to avoid TypeError in comparison
     with pytest.raises(ValueError, match="Unknown processing_mode"):
         ExtractorFactory.create_extractor(
             processing_mode="unknown",
             backend_name="llm",
-            llm_client=mock_client,
+            llm_client=llm_client,
         )
@@ -1,14 +1,34 @@
 """Unit tests for input type detection."""
 
-import tempfile
-from pathlib import Path
-from unittest.mock import patch
-
 import pytest
 
 from docling_graph.core.input.types import InputType, InputTypeDetector
 from docling_graph.exceptions import ConfigurationError
 
+DOCLING_JSON = '{"schema_name": "DoclingDocument", "version": "1.0.0", "name": "test"}'
+REGULAR_JSON = '{"data": "value", "other": "field"}'
+
+
+@pytest.fixture(scope="module")
+def sample_files(tmp_path_factory):
+    """Input files shared by the detection tests, which only read them."""
+    base = tmp_path_factory.mktemp("inputs")
+    contents = {
+        "pdf": ("test.pdf", "%PDF-1.4 fake pdf"),
+        "png": ("test.png", "fake png"),
+        "txt": ("test.txt", "sample text"),
+        "md": ("test.md", "# Markdown"),
+        "docx": ("report.docx", "fake docx"),
+        "docling_json": ("doc.json", DOCLING_JSON),
+        "regular_json": ("regular.json", REGULAR_JSON),
+        "invalid_json": ("invalid.json", "not json {"),
+    }
+    files = {}
+    for key, (name, text) in contents.items():
+        files[key] = base / name
+        files[key].write_text(text)
+    return files
+
 
 class TestInputType:
     """Test InputType enum."""
@@ -32,105 +52,67 @@ class TestInputType:
 class TestInputTypeDetector:
     """Test InputTypeDetector class."""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory for test files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
-
     # ==================== Document Detection (unified path) ====================
 
-    def test_detect_pdf_as_document(self, temp_dir):
-        """Test PDF is detected as DOCUMENT."""
-        pdf_file = temp_dir / "test.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4 fake pdf")
-        result = InputTypeDetector.detect(str(pdf_file), mode="api")
-        assert result == InputType.DOCUMENT
-
-    def test_detect_image_as_document(self, temp_dir):
-        """Test image is detected as DOCUMENT."""
-        img_file = temp_dir / "test.png"
-        img_file.write_bytes(b"fake png")
-        result = InputTypeDetector.detect(str(img_file), mode="api")
-        assert result == InputType.DOCUMENT
-
-    def test_detect_txt_file_as_document(self, temp_dir):
-        """Test .txt file is detected as DOCUMENT."""
-        txt_file = temp_dir / "test.txt"
-        txt_file.write_text("sample text")
-        result = InputTypeDetector.detect(str(txt_file), mode="api")
-        assert result == InputType.DOCUMENT
-
-    def test_detect_markdown_as_document(self, temp_dir):
-        """Test .md file is detected as DOCUMENT."""
-        md_file = temp_dir / "test.md"
-        md_file.write_text("# Markdown")
-        result = InputTypeDetector.detect(str(md_file), mode="api")
-        assert result == InputType.DOCUMENT
-
-    def test_detect_unknown_extension_as_document(self, temp_dir):
-        """Test unknown extension returns DOCUMENT, not rejected."""
-        docx_file = temp_dir / "report.docx"
-        docx_file.write_bytes(b"fake docx")
-        result = InputTypeDetector.detect(str(docx_file), mode="api")
+    @pytest.mark.parametrize("kind", ["pdf", "png", "txt", "md", "docx"])
+    def test_detect_file_as_document(self, sample_files, kind):
+        """Test existing non-JSON files, any extension, are detected as DOCUMENT."""
+        result = InputTypeDetector.detect(sample_files[kind], mode="api")
         assert result == InputType.DOCUMENT
 
     # ==================== URL Detection ====================
 
-    def test_detect_https_url(self):
-        """Test HTTPS URL detection."""
-        url = "https://example.com/document.pdf"
-        result = InputTypeDetector.detect(url, mode="api")
-        assert result == InputType.URL
-
-    def test_detect_http_url(self):
-        """Test HTTP URL detection."""
-        url = "http://example.com/file.txt"
-        result = InputTypeDetector.detect(url, mode="api")
-        assert result == InputType.URL
-
-    def test_detect_url_with_query_params(self):
-        """Test URL detection with query parameters."""
-        url = "https://example.com/doc.pdf?version=1&format=pdf"
-        result = InputTypeDetector.detect(url, mode="api")
-        assert result == InputType.URL
+    @pytest.mark.parametrize(
+        ("url", "mode"),
+        [
+            ("https://example.com/document.pdf", "api"),
+            ("http://example.com/file.txt", "api"),
+            ("https://example.com/doc.pdf?version=1&format=pdf", "api"),
+            # CLI mode accepts URLs without checking the filesystem.
+            ("https://example.com/doc.pdf", "cli"),
+        ],
+        ids=["https", "http", "query_params", "cli_mode"],
+    )
+    def test_detect_url(self, url, mode):
+        """Test URL detection."""
+        assert InputTypeDetector.detect(url, mode=mode) == InputType.URL
 
     # ==================== DoclingDocument Detection ====================
 
-    def test_detect_docling_document_from_content(self, temp_dir):
-        """Test DoclingDocument detection from JSON content."""
-        import json
-
-        doc_data = {"schema_name": "DoclingDocument", "version": "1.0.0", "name": "test"}
-        doc_file = temp_dir / "doc.json"
-        doc_file.write_text(json.dumps(doc_data))
-
-        result = InputTypeDetector.detect(str(doc_file), mode="api")
-        assert result == InputType.DOCLING_DOCUMENT
-
-    def test_detect_regular_json_as_document(self, temp_dir):
-        """Test that regular JSON (not DoclingDocument) is DOCUMENT."""
-        import json
-
-        regular_json = {"data": "value", "other": "field"}
-        json_file = temp_dir / "regular.json"
-        json_file.write_text(json.dumps(regular_json))
-        result = InputTypeDetector.detect(str(json_file), mode="api")
-        assert result == InputType.DOCUMENT
+    @pytest.mark.parametrize(
+        ("kind", "expected"),
+        [
+            ("docling_json", InputType.DOCLING_DOCUMENT),
+            # Regular JSON is not a DoclingDocument and goes to Docling like any file.
+            ("regular_json", InputType.DOCUMENT),
+        ],
+    )
+    def test_detect_json_file(self, sample_files, kind, expected):
+        """Test JSON files are DOCLING_DOCUMENT only when their content is one."""
+        result = InputTypeDetector.detect(sample_files[kind], mode="api")
+        assert result == expected
 
     # ==================== Raw text (API) -> DOCUMENT ====================
 
-    def test_detect_plain_text_api_mode(self):
-        """Test plain text in API mode is DOCUMENT (normalized to .md for Docling)."""
-        text = "This is plain text content"
-        result = InputTypeDetector.detect(text, mode="api")
-        assert result == InputType.DOCUMENT
-
-    def test_detect_plain_text_multiline_api_mode(self):
-        """Test multiline plain text in API mode is DOCUMENT."""
-        text = "Line 1\nLine 2\nLine 3"
-        result = InputTypeDetector.detect(text, mode="api")
-        assert result == InputType.DOCUMENT
+    @pytest.mark.parametrize(
+        ("text", "mode"),
+        [
+            ("This is plain text content", "api"),
+            ("Line 1\nLine 2\nLine 3", "api"),
+            # Empty and whitespace-only input is DOCUMENT here; the handler rejects it.
+            ("", "api"),
+            ("   \n\t  ", "api"),
+            # Non-existent path-like strings are raw text in API mode.
+            ("/nonexistent/path/to/file.txt", "api"),
+            # None leaves mode at its default, which is "api".
+            ("Plain text", None),
+        ],
+        ids=["plain", "multiline", "empty", "whitespace", "path_like", "default_mode"],
+    )
+    def test_detect_raw_text(self, text, mode):
+        """Test raw text in API mode is DOCUMENT (normalized to .md for Docling)."""
+        kwargs = {} if mode is None else {"mode": mode}
+        assert InputTypeDetector.detect(text, **kwargs) == InputType.DOCUMENT
 
     # ==================== CLI Mode ====================
 
@@ -140,59 +122,27 @@ class TestInputTypeDetector:
         with pytest.raises(ConfigurationError, match="not found"):
             InputTypeDetector.detect(text, mode="cli")
 
-    def test_cli_mode_requires_file_existence(self, temp_dir):
+    def test_cli_mode_requires_file_existence(self, tmp_path):
         """Test that CLI mode requires files to exist."""
-        nonexistent = temp_dir / "nonexistent.txt"
+        nonexistent = tmp_path / "nonexistent.txt"
 
         with pytest.raises(ConfigurationError, match="not found"):
             InputTypeDetector.detect(str(nonexistent), mode="cli")
 
-    def test_cli_mode_accepts_existing_files(self, temp_dir):
+    def test_cli_mode_accepts_existing_files(self, sample_files):
         """Test that CLI mode accepts existing files (detected as DOCUMENT)."""
-        txt_file = temp_dir / "test.txt"
-        txt_file.write_text("content")
-        result = InputTypeDetector.detect(str(txt_file), mode="cli")
+        result = InputTypeDetector.detect(sample_files["txt"], mode="cli")
         assert result == InputType.DOCUMENT
 
-    def test_cli_mode_accepts_urls(self):
-        """Test that CLI mode accepts URLs."""
-        url = "https://example.com/doc.pdf"
-        result = InputTypeDetector.detect(url, mode="cli")
-        assert result == InputType.URL
-
     # ==================== Edge Cases ====================
 
-    def test_detect_empty_string_api_mode(self):
-        """Test detection of empty string in API mode (DOCUMENT; handler will reject)."""
-        result = InputTypeDetector.detect("", mode="api")
-        assert result == InputType.DOCUMENT
-
-    def test_detect_whitespace_only_api_mode(self):
-        """Test detection of whitespace-only string in API mode."""
-        result = InputTypeDetector.detect("   \n\t  ", mode="api")
-        assert result == InputType.DOCUMENT
-
-    def test_detect_path_like_string_api_mode(self):
-        """Test that non-existent path-like strings are DOCUMENT (raw text) in API mode."""
-        fake_path = "/nonexistent/path/to/file.txt"
-        result = InputTypeDetector.detect(fake_path, mode="api")
-        assert result == InputType.DOCUMENT
-
-    def test_detect_with_pathlib_path(self, temp_dir):
-        """Test detection with pathlib.Path object."""
-        txt_file = temp_dir / "test.txt"
-        txt_file.write_text("content")
-        result = InputTypeDetector.detect(txt_file, mode="api")
+    def test_detect_with_str_path(self, sample_files):
+        """Test detection with a file path given as a string."""
+        result = InputTypeDetector.detect(str(sample_files["txt"]), mode="api")
         assert result == InputType.DOCUMENT
 
     # ==================== Mode Parameter ====================
 
-    def test_default_mode_is_api(self):
-        """Test that default mode is 'api'."""
-        text = "Plain text"
-        result = InputTypeDetector.detect(text)
-        assert result == InputType.DOCUMENT
-
     def test_invalid_mode_raises_error(self):
         """Test that invalid mode raises error."""
         with pytest.raises(ValueError, match="mode must be"):
@@ -202,12 +152,6 @@ class TestInputTypeDetector:
 class TestInputTypeDetectorHelpers:
     """Test helper methods of InputTypeDetector."""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory for test files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
-
     def test_is_url_helper(self):
         """Test _is_url helper method."""
         assert InputTypeDetector._is_url("https://example.com")
@@ -215,45 +159,29 @@ class TestInputTypeDetectorHelpers:
         assert not InputTypeDetector._is_url("/local/path")
         assert not InputTypeDetector._is_url("plain text")
 
-    def test_detect_from_file_helper(self, temp_dir):
+    @pytest.mark.parametrize(
+        ("kind", "expected"),
+        [
+            ("pdf", InputType.DOCUMENT),
+            ("png", InputType.DOCUMENT),
+            ("txt", InputType.DOCUMENT),
+            ("md", InputType.DOCUMENT),
+            ("docling_json", InputType.DOCLING_DOCUMENT),
+        ],
+    )
+    def test_detect_from_file_helper(self, sample_files, kind, expected):
         """Test _detect_from_file: only JSON can be DOCLING_DOCUMENT; rest are DOCUMENT."""
-        pdf_file = temp_dir / "test.pdf"
-        pdf_file.write_bytes(b"fake")
-        assert InputTypeDetector._detect_from_file(pdf_file) == InputType.DOCUMENT
-
-        img_file = temp_dir / "test.png"
-        img_file.write_bytes(b"fake")
-        assert InputTypeDetector._detect_from_file(img_file) == InputType.DOCUMENT
-
-        txt_file = temp_dir / "test.txt"
-        txt_file.write_text("text")
-        assert InputTypeDetector._detect_from_file(txt_file) == InputType.DOCUMENT
-
-        md_file = temp_dir / "test.md"
-        md_file.write_text("# MD")
-        assert InputTypeDetector._detect_from_file(md_file) == InputType.DOCUMENT
-
-    def test_is_docling_document_helper(self, temp_dir):
+        assert InputTypeDetector._detect_from_file(sample_files[kind]) == expected
+
+    @pytest.mark.parametrize(
+        ("kind", "expected"),
+        [
+            ("docling_json", True),
+            ("invalid_json", False),
+            ("regular_json", False),
+            ("txt", False),
+        ],
+    )
+    def test_is_docling_document_helper(self, sample_files, kind, expected):
         """Test _is_docling_document helper method."""
-        import json
-
-        # Valid DoclingDocument
-        valid_doc = {"schema_name": "DoclingDocument", "version": "1.0.0"}
-        valid_file = temp_dir / "valid.json"
-        valid_file.write_text(json.dumps(valid_doc))
-        assert InputTypeDetector._is_docling_document(valid_file) is True
-
-        # Invalid JSON
-        invalid_file = temp_dir / "invalid.json"
-        invalid_file.write_text("not json {")
-        assert InputTypeDetector._is_docling_document(invalid_file) is False
-
-        # Regular JSON
-        regular_file = temp_dir / "regular.json"
-        regular_file.write_text(json.dumps({"data": "value"}))
-        assert InputTypeDetector._is_docling_document(regular_file) is False
-
-        # Non-JSON file
-        txt_file = temp_dir / "test.txt"
-        txt_file.write_text("text")
-        assert InputTypeDetector._is_docling_document(txt_file) is False
+        assert InputTypeDetector._is_docling_document(sample_files[kind]) is expected
@@ -1,6 +1,5 @@
 """Unit tests for input validators."""
 
-import json
 import tempfile
 from pathlib import Path
 
@@ -13,6 +12,21 @@ from docling_graph.core.input.validators import (
 )
 from docling_graph.exceptions import ValidationError
 
+MINIMAL_DOCLING_JSON = '{"schema_name": "DoclingDocument", "version": "1.0.0"}'
+NAMED_DOCLING_JSON = '{"schema_name": "DoclingDocument", "version": "1.0.0", "name": "test"}'
+PAGED_DOCLING_JSON = (
+    '{"schema_name": "DoclingDocument", "version": "2.0.0", "name": "test", '
+    '"pages": {}, "body": {}}'
+)
+EXTRA_FIELDS_DOCLING_JSON = (
+    '{"schema_name": "DoclingDocument", "version": "1.0.0", "name": "test", '
+    '"pages": {"0": {"page_no": 0}}, "body": {"children": []}, "furniture": {}, '
+    '"extra_field": "extra_value"}'
+)
+MISSING_SCHEMA_NAME_JSON = '{"version": "1.0.0", "name": "test"}'
+WRONG_SCHEMA_NAME_JSON = '{"schema_name": "WrongSchema", "version": "1.0.0"}'
+MISSING_VERSION_JSON = '{"schema_name": "DoclingDocument", "name": "test"}'
+
 
 class TestTextValidator:
     """Test TextValidator class."""
@@ -151,82 +165,44 @@ class TestDoclingDocumentValidator:
         with tempfile.TemporaryDirectory() as tmpdir:
             yield Path(tmpdir)
 
-    def test_accepts_valid_docling_document(self):
+    @pytest.mark.parametrize(
+        "payload",
+        [MINIMAL_DOCLING_JSON, NAMED_DOCLING_JSON, PAGED_DOCLING_JSON, EXTRA_FIELDS_DOCLING_JSON],
+        ids=["minimal", "named", "pages_and_body", "extra_fields"],
+    )
+    def test_accepts_valid_docling_document(self, payload):
         """Test that valid DoclingDocument JSON passes validation."""
-        validator = DoclingDocumentValidator()
-        valid_docs = [
-            {
-                "schema_name": "DoclingDocument",
-                "version": "1.0.0",
-                "name": "test",
-            },
-            {
-                "schema_name": "DoclingDocument",
-                "version": "2.0.0",
-                "name": "test",
-                "pages": {},
-                "body": {},
-            },
-        ]
-        for doc in valid_docs:
-            json_str = json.dumps(doc)
-            validator.validate(json_str)  # Should not raise
+        DoclingDocumentValidator().validate(payload)  # Should not raise
 
-    def test_rejects_invalid_json(self):
-        """Test that invalid JSON is rejected."""
-        validator = DoclingDocumentValidator()
-        invalid_jsons = [
+    @pytest.mark.parametrize(
+        "payload",
+        [
             "not json",
             "{invalid json",
             '{"key": value}',  # Unquoted value
             "",
-        ]
-        for invalid in invalid_jsons:
-            with pytest.raises(ValidationError, match="Invalid JSON"):
-                validator.validate(invalid)
-
-    def test_rejects_missing_schema_name(self):
-        """Test that documents without schema_name are rejected."""
-        validator = DoclingDocumentValidator()
-        doc = {
-            "version": "1.0.0",
-            "name": "test",
-        }
-        json_str = json.dumps(doc)
-        with pytest.raises(ValidationError, match="Missing required field: schema_name"):
-            validator.validate(json_str)
-
-    def test_rejects_wrong_schema_name(self):
-        """Test that documents with wrong schema_name are rejected."""
-        validator = DoclingDocumentValidator()
-        doc = {
-            "schema_name": "WrongSchema",
-            "version": "1.0.0",
-        }
-        json_str = json.dumps(doc)
-        with pytest.raises(ValidationError, match="schema_name must be 'DoclingDocument'"):
-            validator.validate(json_str)
-
-    def test_rejects_missing_version(self):
-        """Test that documents without version are rejected."""
-        validator = DoclingDocumentValidator()
-        doc = {
-            "schema_name": "DoclingDocument",
-            "name": "test",
-        }
-        json_str = json.dumps(doc)
-        with pytest.raises(ValidationError, match="Missing required field: version"):
-            validator.validate(json_str)
-
-    def test_accepts_minimal_valid_document(self):
-        """Test that minimal valid document is accepted."""
-        validator = DoclingDocumentValidator()
-        doc = {
-            "schema_name": "DoclingDocument",
-            "version": "1.0.0",
-        }
-        json_str = json.dumps(doc)
-        validator.validate(json_str)  # Should not raise
+            "   \n\t  ",
+        ],
+        ids=["plain_text", "unclosed", "unquoted_value", "empty", "whitespace"],
+    )
+    def test_rejects_invalid_json(self, payload):
+        """Test that invalid JSON is rejected."""
+        with pytest.raises(ValidationError, match="Invalid JSON"):
+            DoclingDocumentValidator().validate(payload)
+
+    @pytest.mark.parametrize(
+        ("payload", "message"),
+        [
+            (MISSING_SCHEMA_NAME_JSON, "Missing required field: schema_name"),
+            (WRONG_SCHEMA_NAME_JSON, "schema_name must be 'DoclingDocument'"),
+            (MISSING_VERSION_JSON, "Missing required field: version"),
+        ],
+        ids=["missing_schema_name", "wrong_schema_name", "missing_version"],
+    )
+    def test_rejects_incomplete_document(self, payload, message):
+        """Test that documents missing or mislabelling required fields are rejected."""
+        with pytest.raises(ValidationError, match=message):
+            DoclingDocumentValidator().validate(payload)
 
     def test_rejects_none(self):
         """Test that None is rejected."""
@@ -234,33 +210,6 @@ class TestDoclingDocumentValidator:
         with pytest.raises(ValidationError):
             validator.validate(None)
 
-    def test_accepts_document_with_extra_fields(self):
-        """Test that documents with extra fields are accepted."""
-        validator = DoclingDocumentValidator()
-        doc = {
-            "schema_name": "DoclingDocument",
-            "version": "1.0.0",
-            "name": "test",
-            "pages": {"0": {"page_no": 0}},
-            "body": {"children": []},
-            "furniture": {},
-            "extra_field": "extra_value",
-        }
-        json_str = json.dumps(doc)
-        validator.validate(json_str)  # Should not raise
-
-    def test_rejects_empty_string(self):
-        """Test that empty string is rejected."""
-        validator = DoclingDocumentValidator()
-        with pytest.raises(ValidationError, match="Invalid JSON"):
-            validator.validate("")
-
-    def test_rejects_whitespace_only(self):
-        """Test that whitespace-only string is rejected."""
-        validator = DoclingDocumentValidator()
-        with pytest.raises(ValidationError, match="Invalid JSON"):
-            validator.validate("   \n\t  ")
-
 
 class TestValidatorErrorMessages:
     """Test that validators provide clear error messages."""
@@ -294,9 +243,8 @@ class TestValidatorErrorMessages:
     def test_docling_validator_error_message_schema(self):
         """Test DoclingDocumentValidator error message for missing schema."""
         validator = DoclingDocumentValidator()
-        doc = {"version": "1.0.0"}
         try:
-            validator.validate(json.dumps(doc))
+            validator.validate(MISSING_SCHEMA_NAME_JSON)
         except ValidationError as e:
             assert "schema_name" in str(e).lower()
             assert e.details is not None